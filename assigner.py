@@ -29,7 +29,9 @@ showSolution().
 Scheduler uses a randomized greedy algorithm to compute solutions. In each iteration, it
 selects a candidate for an assignment from a list by a lottery weighted by preference. Tuning
 the preference scale has an enormous effect on the number of solutions this algorithm finds. In
-general, preference values that are small (1-5) seem to work better.
+general, preference values that are small (1-5) seem to work better. Rather than tuning the
+scale by hand, the tuner module can sweep the prefBias and prefExponent arguments of
+Scheduler() on your table and recommend the setting that finds good solutions fastest.
 '''
 import numpy as _np
 from copy import deepcopy
@@ -224,13 +226,16 @@ class ConstraintsTable:
 		j = self.assignmentsList.index(assignment)+1
 		return self.array[1:,j]
 
-	def lotteryAssignment(self,assignment):
+	def lotteryAssignment(self,assignment,prefBias=1,prefExponent=1):
 		'''
 		Returns a person from the candidates of assignment based on a lottery weighted
-		by their preferences.
+		by their preferences. Before the lottery, preferences greater than unit are
+		multiplied by prefBias and then every weight is raised to the power prefExponent.
+		The defaults leave the preferences as they are in the table.
 		'''
 		candidates = self.getCandidates(assignment)
-		lottery = _np.random.rand(len(candidates))*candidates
+		weights = _np.where(candidates > 1,candidates*prefBias,candidates)**prefExponent
+		lottery = _np.random.rand(len(candidates))*weights
 		if max(lottery) == 0.0:
 			return None
 		person = max(self.peopleList, key = lambda x: lottery[self.peopleList.index(x)])
@@ -295,12 +300,15 @@ class Scheduler:
 	'''
 	This class implements the scheduling algorithm.
 	'''
-	def __init__(self,table=None,constraintsList = [], order = 1e4, extraProcessing = None):
+	def __init__(self,table=None,constraintsList = [], order = 1e4, extraProcessing = None,
+				prefBias = 1, prefExponent = 1):
 		'''
 		The constraints list should be a list of people assignment pairs. The order argument
 		is the number of solutions that will be attempted. The extraProcessing argument is an
 		optional function that will be called on the table just before performing a scheduling.
-		It should return a list of tables.
+		It should return a list of tables. The prefBias and prefExponent arguments are passed
+		on to ConstraintsTable().lotteryAssignment() and only change the lottery, not the
+		scoring of solutions. The tuner module can pick them for you.
 		'''
 		if table is None:
 			table = ConstraintsTable()
@@ -311,6 +319,8 @@ class Scheduler:
 		self.constraintsList = []
 		self.scoreMemo = {}
 		self.extraProcessing = extraProcessing
+		self.prefBias = prefBias
+		self.prefExponent = prefExponent
 
 	def generateSolutions(self,allowIncomplete='standard'):
 		'''
@@ -342,26 +352,32 @@ class Scheduler:
 					allowIncomplete = False
 
 			for loopNumber in range(int(self.order)):
-				t = deepcopy(table)
-				solved = True
-				while (not t.determined):
-					j = t.mostConstrainedAssignment(allowIncomplete,skipMarked = True)
-					if j is None:
-						solved = False
-						break
-					p = t.lotteryAssignment(j)
-					if p is None:
-						t.markAssignment(j)
-					else:
-						t.selectPair(p,j)
-				if solved:
+				solution = self.attemptSolution(table,allowIncomplete)
+				if solution is not None:
 					numSolved +=1
-					solutions.append((i,t.outputSolution()))
+					solutions.append((i,solution))
 				else:
 					numFailed +=1
 		print "%s solutions found. %s solutions failed." %(numSolved,numFailed)
 		return solutions
 
+	def attemptSolution(self,table,allowIncomplete):
+		'''
+		Runs a single trial of the randomized greedy algorithm on a copy of table. Returns
+		the fully constrained table, or None if the trial got stuck.
+		'''
+		t = deepcopy(table)
+		while (not t.determined):
+			j = t.mostConstrainedAssignment(allowIncomplete,skipMarked = True)
+			if j is None:
+				return None
+			p = t.lotteryAssignment(j,self.prefBias,self.prefExponent)
+			if p is None:
+				t.markAssignment(j)
+			else:
+				t.selectPair(p,j)
+		return t.outputSolution()
+
 	def showSolution(self,solution):
 		'''
 		Prints in a human readable way the result of solution.outputPairs(). For some 
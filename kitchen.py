@@ -61,6 +61,7 @@ accompanying files might be just be useful to ya.
 
 
 import kitchen as k
+import tuner
 import csv
 
 # Well write here is where I import the data file that I got from the Googles
@@ -113,6 +114,9 @@ table.addRectangularConstraint(bigCooks,[b for b in k.standardJobsList if 'Big C
 
 #Last thing I done is do the actual scheduling with the Scheduler
 s = k.Scheduler(table,order=1e3,extraProcessing=k.combineHalfers)
+# If too many of them solutions are failin', have the tuner try a few lottery settings
+# for a handful of trials each before the real run. It'll set the best one on s for ya.
+tuner.tune(s,trials=20)
 sol = s.optimalSolution(allowIncomplete = 'standard')
 if sol is not None:
     k.printSolution(sol)
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+#--------------------------------------------------------------------------------
+# Name:			tuner.py
+# Author:		Evan Lynch
+#
+# Copyright:	Copyright © 2013 Evan F. Lynch
+# License:		Not Released, but do what you want.
+#--------------------------------------------------------------------------------
+'''
+This module contains functions for tuning the lottery of an assigner.Scheduler to a
+particular ConstraintsTable. The number of solutions Scheduler finds depends a great deal
+on how the preferences are scaled, so rather than picking prefBias and raising order
+until enough trials succeed, you can sweep a grid of lottery settings with a short trial
+budget and let the sweep pick one.
+
+To use this module, prepare your Scheduler as usual and call tune(scheduler). Each
+combination of prefBias and prefExponent is tried for the given number of trials in its
+own process. Every setting is scored against the untransformed table, so the scores can
+be compared with each other. tune() prints a summary, recommends the setting that is
+expected to reach the target score in the fewest trials, and by default stores that
+setting on the scheduler, ready for Scheduler().optimalSolution().
+
+Note that prefExponent also covers a lottery "temperature": raising the weights to the
+power 1/T is the same as using prefExponent = 1/T.
+
+On platforms without fork, call tune() from under an if __name__ == '__main__' guard.
+'''
+import numpy as _np
+import time
+from multiprocessing import Pool
+from assigner import Scheduler
+
+def _runTrials(job):
+	'''
+	Runs trials attempts of the scheduling algorithm on each table with one lottery
+	setting. Returns the setting, the list of scores (None for failed trials) in the
+	order they were attempted, and the number of seconds it took.
+	'''
+	(tables,prefBias,prefExponent,trials,allowIncomplete,seed) = job
+	_np.random.seed(seed)
+	scheduler = Scheduler(order=trials,prefBias=prefBias,prefExponent=prefExponent)
+	scheduler.tables = tables
+	scores = []
+	start = time.time()
+	for loopNumber in range(int(trials)):
+		for i,table in enumerate(tables):
+			solution = scheduler.attemptSolution(table,allowIncomplete)
+			if solution is None:
+				scores.append(None)
+			else:
+				scores.append(scheduler.evaluateSolution((i,solution)))
+	return (prefBias,prefExponent,scores,time.time()-start)
+
+def sweep(scheduler,biases=(1,1.5,2,3),exponents=(0.5,1,2),trials=20,
+		allowIncomplete='standard',processes=None):
+	'''
+	Tries every combination of biases and exponents on the scheduler's table, running
+	trials attempts per table for each. The extraProcessing function of the scheduler is
+	called once so that every setting sees the same tables. The combinations are run in
+	parallel with processes worker processes (by default one per cpu). Returns a list
+	with a dictionary of results for each combination.
+	'''
+	if scheduler.extraProcessing is None:
+		tables = [scheduler.table]
+	else:
+		tables = scheduler.extraProcessing(scheduler.table)
+
+	if allowIncomplete is 'standard':
+		allowIncomplete = tables[0].shape[0] < tables[0].shape[1]
+
+	jobs = []
+	for b in biases:
+		for e in exponents:
+			seed = _np.random.randint(2**31-1)
+			jobs.append((tables,b,e,trials,allowIncomplete,seed))
+
+	if processes == 1:
+		outputs = map(_runTrials,jobs)
+	else:
+		pool = Pool(processes)
+		outputs = pool.map(_runTrials,jobs)
+		pool.close()
+		pool.join()
+
+	results = []
+	for (prefBias,prefExponent,scores,seconds) in outputs:
+		solved = [s for s in scores if s is not None]
+		if solved:
+			bestScore = max(solved)
+		else:
+			bestScore = None
+		results.append({'prefBias':prefBias,
+						'prefExponent':prefExponent,
+						'scores':scores,
+						'trials':len(scores),
+						'solved':len(solved),
+						'solveRate':float(len(solved))/len(scores),
+						'bestScore':bestScore,
+						'seconds':seconds,
+						'trialsPerSecond':len(scores)/max(seconds,1e-9)})
+	return results
+
+def recommend(results,target=None):
+	'''
+	Adds to each dictionary in results the expected number of trials and seconds it
+	takes to find a solution scoring at least target, and returns the dictionary with
+	the fewest expected trials. Ties go to the higher solve rate. If target is None,
+	the best score found in the sweep is used. Returns None if no trial was solved.
+	'''
+	if target is None:
+		bestScores = [r['bestScore'] for r in results if r['bestScore'] is not None]
+		if bestScores == []:
+			target = float("inf")
+		else:
+			target = max(bestScores)
+
+	for r in results:
+		hits = len([s for s in r['scores'] if s is not None and s >= target])
+		r['target'] = target
+		if hits == 0:
+			r['expectedTrials'] = float("inf")
+			r['expectedSeconds'] = float("inf")
+		else:
+			r['expectedTrials'] = float(r['trials'])/hits
+			r['expectedSeconds'] = r['expectedTrials']/r['trialsPerSecond']
+
+	best = min(results, key = lambda r: (r['expectedTrials'],-r['solveRate']))
+	if best['expectedTrials'] == float("inf"):
+		return None
+	return best
+
+def showResults(results):
+	'''
+	Prints in a human readable way the results of sweep(), after recommend() has
+	been called on them.
+	'''
+	print "  bias  exponent  solved  best score  trials/s  trials to target"
+	for r in results:
+		print "%6.2f  %8.2f  %5.1f%%  %10s  %8.1f  %16.1f" % (r['prefBias'],r['prefExponent'],
+			100*r['solveRate'],r['bestScore'],r['trialsPerSecond'],r['expectedTrials'])
+
+def tune(scheduler,biases=(1,1.5,2,3),exponents=(0.5,1,2),trials=20,target=None,
+		allowIncomplete='standard',processes=None,apply=True):
+	'''
+	Sweeps the lottery settings with sweep(), prints the results and returns the
+	recommended result from recommend(). If apply is True, the recommended prefBias
+	and prefExponent are also set on the scheduler. Returns None and leaves the
+	scheduler alone if no setting reached the target.
+	'''
+	results = sweep(scheduler,biases,exponents,trials,allowIncomplete,processes)
+	best = recommend(results,target)
+	showResults(results)
+	if best is None:
+		print "No setting reached the target"
+		return None
+	print "Recommended prefBias %s and prefExponent %s (target score %s)" % (
+		best['prefBias'],best['prefExponent'],best['target'])
+	if apply:
+		scheduler.prefBias = best['prefBias']
+		scheduler.prefExponent = best['prefExponent']
+	return best